@@ -4,12 +4,65 @@ from __future__ import annotations
 
 import ast
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable
 
 if TYPE_CHECKING:
     from sloppy.patterns.base import BasePattern, Issue
 
 
+# Per visitor class: AST node class -> visit_* method name
+_VISITOR_METHODS: dict[type, dict[type, str]] = {}
+
+
+def _visitor_method_names(cls: type) -> dict[type, str]:
+    """Map AST node classes to the visit_* methods defined on a visitor class."""
+    methods = _VISITOR_METHODS.get(cls)
+    if methods is None:
+        methods = {}
+        for name in dir(cls):
+            if name.startswith("visit_"):
+                node_class = getattr(ast, name[len("visit_") :], None)
+                if isinstance(node_class, type) and issubclass(node_class, ast.AST):
+                    methods[node_class] = name
+        _VISITOR_METHODS[cls] = methods
+    return methods
+
+
+# Fields that hold identifiers, flags or constants in every node class that has
+# them, so generic_visit never needs to look inside them. "name" isn't one: it
+# is an ast.Name in ast.TypeAlias (3.12+).
+_SCALAR_FIELDS = frozenset(
+    {
+        "arg",
+        "asname",
+        "attr",
+        "conversion",
+        "id",
+        "is_async",
+        "kind",
+        "level",
+        "lineno",
+        "module",
+        "rest",
+        "simple",
+        "tag",
+        "type_comment",
+    }
+)
+
+# AST node class -> fields that may contain child nodes
+_CHILD_FIELDS: dict[type, tuple[str, ...]] = {ast.Constant: ()}
+
+
+def _child_fields(node_class: type) -> tuple[str, ...]:
+    """Return the fields of an AST node class that may contain child nodes."""
+    fields = _CHILD_FIELDS.get(node_class)
+    if fields is None:
+        fields = tuple(f for f in node_class._fields if f not in _SCALAR_FIELDS)
+        _CHILD_FIELDS[node_class] = fields
+    return fields
+
+
 class ASTAnalyzer(ast.NodeVisitor):
     """Analyzes Python AST for pattern violations."""
 
@@ -18,6 +71,8 @@ class ASTAnalyzer(ast.NodeVisitor):
         file: Path,
         source: str,
         patterns: list[BasePattern],
+        check_nesting: bool = True,
+        patterns_by_type: dict[type, list[BasePattern]] | None = None,
     ):
         self.file = file
         self.source = source
@@ -25,20 +80,66 @@ class ASTAnalyzer(ast.NodeVisitor):
         self.patterns = patterns
         self.issues: list[Issue] = []
         self.nesting_depth = 0
+        # Whether to report deep_nesting issues
+        self.check_nesting = check_nesting
+        # Lines inside multi-line strings, collected during the same traversal
+        self.multiline_string_lines: set[int] = set()
+        # Ancestors of the node being visited; the last one is its parent
+        self._parents: list[ast.AST] = []
+        # Node type -> patterns that check it, filled in as types are first seen.
+        # Callers scanning many files with the same patterns can share one.
+        self._patterns_by_type = {} if patterns_by_type is None else patterns_by_type
+        # Bound handlers keyed by exact node type, resolved once per analyzer
+        self._dispatch: dict[type, Callable[[Any], None]] = {
+            node_class: getattr(self, name)
+            for node_class, name in _visitor_method_names(type(self)).items()
+        }
 
     def analyze(self, tree: ast.AST) -> list[Issue]:
         """Run analysis on the AST."""
         self.visit(tree)
         return self.issues
 
+    def visit(self, node: ast.AST) -> None:
+        """Visit a node via the dispatch table instead of a per-node getattr."""
+        handler = self._dispatch.get(type(node))
+        if handler is None:
+            self.generic_visit(node)
+        else:
+            handler(node)
+
+    def generic_visit(self, node: ast.AST) -> None:
+        """Visit child nodes, skipping fields known to hold only scalars."""
+        self._parents.append(node)
+        for field in _child_fields(type(node)):
+            value = getattr(node, field, None)
+            if isinstance(value, list):
+                for item in value:
+                    if isinstance(item, ast.AST):
+                        self.visit(item)
+            elif isinstance(value, ast.AST):
+                self.visit(value)
+        self._parents.pop()
+
+    def _patterns_for(self, node_class: type) -> list[BasePattern]:
+        """Return the patterns that apply to nodes of the given class."""
+        patterns = self._patterns_by_type.get(node_class)
+        if patterns is None:
+            patterns = []
+            for pattern in self.patterns:
+                if hasattr(pattern, "check_node"):
+                    node_types = getattr(pattern, "node_types", ())
+                    if not node_types or issubclass(node_class, node_types):
+                        patterns.append(pattern)
+            self._patterns_by_type[node_class] = patterns
+        return patterns
+
     def _check_patterns(self, node: ast.AST) -> None:
         """Run all applicable patterns on a node."""
-        for pattern in self.patterns:
-            if hasattr(pattern, "check_node"):
-                node_types = getattr(pattern, "node_types", ())
-                if not node_types or isinstance(node, node_types):
-                    issues = pattern.check_node(node, self.file, self.source_lines)
-                    self.issues.extend(issues)
+        parents = self._parents
+        for pattern in self._patterns_for(type(node)):
+            issues = pattern.check_node(node, self.file, self.source_lines, parents=parents)
+            self.issues.extend(issues)
 
     def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
         """Visit function definitions."""
@@ -55,6 +156,13 @@ class ASTAnalyzer(ast.NodeVisitor):
         self._check_patterns(node)
         self.generic_visit(node)
 
+    def visit_Constant(self, node: ast.Constant) -> None:
+        """Record lines covered by multi-line string literals."""
+        if isinstance(node.value, str):
+            end_line = node.end_lineno
+            if end_line is not None and end_line > node.lineno:
+                self.multiline_string_lines.update(range(node.lineno, end_line + 1))
+
     def visit_ExceptHandler(self, node: ast.ExceptHandler) -> None:
         """Visit except handlers."""
         self._check_patterns(node)
@@ -105,7 +213,7 @@ class ASTAnalyzer(ast.NodeVisitor):
         self.nesting_depth += 1
 
         # Check for deep nesting
-        if self.nesting_depth > 4:
+        if self.check_nesting and self.nesting_depth > 4:
             from sloppy.patterns.base import Issue, Severity
 
             self.issues.append(
@@ -3,79 +3,86 @@
 from __future__ import annotations
 
 import importlib.util
+import os
 import sys
+from functools import cache, lru_cache
 from pathlib import Path
 
-# Standard library modules (Python 3.9+)
-STDLIB_MODULES: set[str] = (
-    set(sys.stdlib_module_names)
-    if hasattr(sys, "stdlib_module_names")
-    else {
-        "abc",
-        "argparse",
-        "ast",
-        "asyncio",
-        "base64",
-        "collections",
-        "configparser",
-        "contextlib",
-        "copy",
-        "csv",
-        "dataclasses",
-        "datetime",
-        "decimal",
-        "difflib",
-        "email",
-        "enum",
-        "functools",
-        "glob",
-        "hashlib",
-        "html",
-        "http",
-        "importlib",
-        "inspect",
-        "io",
-        "itertools",
-        "json",
-        "logging",
-        "math",
-        "multiprocessing",
-        "operator",
-        "os",
-        "pathlib",
-        "pickle",
-        "platform",
-        "pprint",
-        "re",
-        "shutil",
-        "signal",
-        "socket",
-        "sqlite3",
-        "string",
-        "subprocess",
-        "sys",
-        "tempfile",
-        "textwrap",
-        "threading",
-        "time",
-        "traceback",
-        "types",
-        "typing",
-        "unittest",
-        "urllib",
-        "uuid",
-        "warnings",
-        "weakref",
-        "xml",
-        "zipfile",
-    }
+# Standard library modules (Python 3.9+), interned so membership tests against
+# identifier strings from the parser can short-circuit on identity
+STDLIB_MODULES: frozenset[str] = frozenset(
+    sys.intern(name)
+    for name in (
+        sys.stdlib_module_names
+        if hasattr(sys, "stdlib_module_names")
+        else {
+            "abc",
+            "argparse",
+            "ast",
+            "asyncio",
+            "base64",
+            "collections",
+            "configparser",
+            "contextlib",
+            "copy",
+            "csv",
+            "dataclasses",
+            "datetime",
+            "decimal",
+            "difflib",
+            "email",
+            "enum",
+            "functools",
+            "glob",
+            "hashlib",
+            "html",
+            "http",
+            "importlib",
+            "inspect",
+            "io",
+            "itertools",
+            "json",
+            "logging",
+            "math",
+            "multiprocessing",
+            "operator",
+            "os",
+            "pathlib",
+            "pickle",
+            "platform",
+            "pprint",
+            "re",
+            "shutil",
+            "signal",
+            "socket",
+            "sqlite3",
+            "string",
+            "subprocess",
+            "sys",
+            "tempfile",
+            "textwrap",
+            "threading",
+            "time",
+            "traceback",
+            "types",
+            "typing",
+            "unittest",
+            "urllib",
+            "uuid",
+            "warnings",
+            "weakref",
+            "xml",
+            "zipfile",
+        }
+    )
 )
 
 
+@cache
 def module_exists(module_name: str) -> bool:
     """Check if a module/package exists in the Python environment."""
     # Check stdlib first (fast path)
-    base = module_name.split(".")[0]
+    base = module_name.partition(".")[0]
     if base in STDLIB_MODULES:
         return True
 
@@ -103,7 +110,7 @@ def validate_import(module_name: str, name: str | None = None) -> str | None:
             return hallucination_msg
 
     # Check if base module exists
-    base_module = module_name.split(".")[0]
+    base_module = module_name.partition(".")[0]
     if not module_exists(base_module):
         return f"Module '{module_name}' does not exist"
 
@@ -176,24 +183,91 @@ KNOWN_HALLUCINATIONS = {
 }
 
 
+# Only the entries that produce a message; None entries mark valid imports and
+# would just cost a lookup that falls through
+_KNOWN_HALLUCINATION_MESSAGES: dict[tuple[str, str | None], str] = {
+    key: message for key, message in KNOWN_HALLUCINATIONS.items() if message is not None
+}
+
+
 def check_known_hallucination(module: str, name: str | None) -> str | None:
     """Check if this is a known hallucinated import pattern."""
     # Check exact match
     if name is not None:
-        result = KNOWN_HALLUCINATIONS.get((module, name))
+        result = _KNOWN_HALLUCINATION_MESSAGES.get((module, name))
         if result is not None:
             return result
 
     # Check module-only patterns (name=None in dict)
-    # Use a cast since the dict has mixed None/str values
-    key: tuple[str, str | None] = (module, None)
-    module_only = KNOWN_HALLUCINATIONS.get(key)  # type: ignore[arg-type]
-    if module_only is not None:
-        return module_only
+    return _KNOWN_HALLUCINATION_MESSAGES.get((module, None))
 
-    return None
+
+# Common AI hallucination patterns - these are generic names AI often invents
+# that don't exist as real packages
+HALLUCINATED_MODULES = {
+    "utils": "Module 'utils' does not exist - did you mean a local module?",
+    "helpers": "Module 'helpers' does not exist - did you mean a local module?",
+    "common": "Module 'common' does not exist - did you mean a local module?",
+}
 
 
+@lru_cache(maxsize=1024)
+def _dir_entries(directory: Path) -> dict[str, bool]:
+    """List a directory once, mapping entry names to whether they are directories."""
+    try:
+        with os.scandir(directory) as it:
+            return {entry.name: entry.is_dir() for entry in it}
+    except OSError:
+        return {}
+
+
+@lru_cache(maxsize=1024)
+def _local_module_dirs(source_dir: Path) -> tuple[Path, ...]:
+    """Return source_dir and the parent package roots searched for local modules."""
+    dirs = [source_dir]
+    current = source_dir
+    for _ in range(2):  # Look up to 3 levels
+        parent = current.parent
+        # Only continue if current dir is a package
+        if parent == current or "__init__.py" not in _dir_entries(current):
+            break
+        current = parent
+        dirs.append(current)
+    return tuple(dirs)
+
+
+@lru_cache(maxsize=8192)
+def _is_local_module(source_dir: Path, base: str) -> bool:
+    """Check if base is a module or package in source_dir or a parent package root."""
+    for directory in _local_module_dirs(source_dir):
+        entries = _dir_entries(directory)
+        # module.py, or a module/ package directory
+        if f"{base}.py" in entries or entries.get(base, False):
+            return True
+    return False
+
+
+@lru_cache(maxsize=1024)
+def local_module_state(source_dir: Path) -> str:
+    """Describe the modules that imports from files in source_dir may resolve to.
+
+    Lists the .py files and subdirectories of every directory searched for
+    local modules, so callers caching import checks can tell when one is
+    added or removed.
+    """
+    parts = []
+    for directory in _local_module_dirs(source_dir):
+        names = []
+        for name, is_dir in _dir_entries(directory).items():
+            module = name if is_dir else name[:-3] if name.endswith(".py") else ""
+            # Skip unimportable names, so e.g. creating .sloppy_cache/ changes nothing
+            if module.isidentifier() and module != "__pycache__":
+                names.append(name)
+        parts.append(f"{directory}:{'/'.join(sorted(names))}")
+    return "\n".join(parts)
+
+
+@lru_cache(maxsize=4096)
 def is_likely_hallucinated_package(
     module_name: str,
     source_file: Path | None = None,
@@ -211,34 +285,11 @@ def is_likely_hallucinated_package(
     Returns error message if likely hallucinated, None otherwise.
     """
 
-    base = module_name.split(".")[0]
+    base = module_name.partition(".")[0]
 
-    # Check if it's a local file in the same directory as the source file
-    if source_file is not None:
-        source_dir = source_file.parent
-        # Check for module_name.py in same directory
-        local_module = source_dir / f"{base}.py"
-        if local_module.exists():
-            return None
-        # Check for module_name/ package directory
-        local_package = source_dir / base
-        if local_package.is_dir() and (local_package / "__init__.py").exists():
-            return None
-        # Check for relative imports - look for the module in parent directories
-        # that might be package roots (have __init__.py)
-        current = source_dir
-        for _ in range(3):  # Look up to 3 levels
-            if (current / f"{base}.py").exists():
-                return None
-            if (current / base).is_dir():
-                return None
-            parent = current.parent
-            if parent == current:
-                break
-            # Only continue if current dir is a package
-            if not (current / "__init__.py").exists():
-                break
-            current = parent
+    # Check if it's a local file next to the source file or in a parent package
+    if source_file is not None and _is_local_module(source_file.parent, base):
+        return None
 
     # Check if it's a stdlib module (always valid)
     if base in STDLIB_MODULES:
@@ -254,17 +305,8 @@ def is_likely_hallucinated_package(
 
     # Non-strict mode (default): Only flag KNOWN AI hallucination patterns
     # This avoids false positives for legitimate third-party packages
-
-    # Common AI hallucination patterns - these are generic names AI often invents
-    # that don't exist as real packages
-    hallucinated_patterns = {
-        "utils": "Module 'utils' does not exist - did you mean a local module?",
-        "helpers": "Module 'helpers' does not exist - did you mean a local module?",
-        "common": "Module 'common' does not exist - did you mean a local module?",
-    }
-
-    if base in hallucinated_patterns:
-        return hallucinated_patterns[base]
+    if base in HALLUCINATED_MODULES:
+        return HALLUCINATED_MODULES[base]
 
     # Don't flag unknown modules as hallucinations - they might be:
     # - Local modules we couldn't find
@@ -430,17 +472,33 @@ HALLUCINATED_METHODS = {
 }
 
 
+# Precomputed error messages for hallucinated methods; methods whose correction
+# is None are valid Python and are left out
+_HALLUCINATED_METHOD_MESSAGES: dict[str, str] = {
+    method_name: f"'{method_name}' is not a Python method. {hint}"
+    for method_name, (correct, hint) in HALLUCINATED_METHODS.items()
+    if correct is not None
+}
+
+
 def check_hallucinated_method(method_name: str) -> str | None:
     """
     Check if a method name is a known hallucination.
 
     Returns error message with correction if hallucinated, None otherwise.
     """
-    if method_name not in HALLUCINATED_METHODS:
-        return None
+    return _HALLUCINATED_METHOD_MESSAGES.get(method_name)
 
-    correct, hint = HALLUCINATED_METHODS[method_name]
-    if correct is None:
-        return None  # Method is valid
 
-    return f"'{method_name}' is not a Python method. {hint}"
+def clear_caches() -> None:
+    """Forget cached module lookups and directory listings.
+
+    Called at the start of each scan so files added or removed since the last
+    scan in the same process are seen.
+    """
+    module_exists.cache_clear()
+    _dir_entries.cache_clear()
+    _local_module_dirs.cache_clear()
+    _is_local_module.cache_clear()
+    local_module_state.cache_clear()
+    is_likely_hallucinated_package.cache_clear()
@@ -0,0 +1,96 @@
+"""On-disk cache of per-file scan results."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from sloppy import __version__
+from sloppy.patterns.base import Issue, Severity
+
+DEFAULT_CACHE_DIR = Path(".sloppy_cache")
+
+
+class IssueCache:
+    """Per-file issue cache keyed by a hash of the file's source.
+
+    Entries are stored as JSON rather than pickle so that a cache directory
+    checked in alongside untrusted code can never execute anything on load.
+    """
+
+    def __init__(self, cache_dir: Path, salt: str = ""):
+        self.cache_dir = cache_dir
+        # Extra key material, e.g. the enabled pattern IDs
+        self.salt = salt
+
+    def key(self, path: Path, content: bytes, context: str = "") -> str:
+        """Return the cache key for a file with the given raw content.
+
+        context is anything else the file's results depend on, such as the
+        modules next to it that its imports may resolve to.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (__version__, self.salt, str(path), context):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        digest.update(content)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> list[Issue] | None:
+        """Return cached issues for key, or None on a miss."""
+        try:
+            data = json.loads(self._entry_path(key).read_text(encoding="utf-8"))
+            return [_issue_from_dict(item) for item in data]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def set(self, key: str, issues: list[Issue]) -> None:
+        """Store issues under key. Failures are ignored; caching is best-effort."""
+        entry = self._entry_path(key)
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=entry.parent, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump([_issue_to_dict(issue) for issue in issues], f)
+            # Atomic rename so concurrent runs never see a partial entry
+            os.replace(tmp_name, entry)
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+
+def _issue_to_dict(issue: Issue) -> dict[str, Any]:
+    return {
+        "pattern_id": issue.pattern_id,
+        "severity": issue.severity.value,
+        "axis": issue.axis,
+        "file": str(issue.file),
+        "line": issue.line,
+        "column": issue.column,
+        "message": issue.message,
+        "code": issue.code,
+    }
+
+
+def _issue_from_dict(data: dict[str, Any]) -> Issue:
+    return Issue(
+        pattern_id=data["pattern_id"],
+        severity=Severity(data["severity"]),
+        axis=data["axis"],
+        file=Path(data["file"]),
+        line=data["line"],
+        column=data["column"],
+        message=data["message"],
+        code=data["code"],
+    )
@@ -7,12 +7,21 @@ import sys
 from pathlib import Path
 
 from sloppy import __version__
-from sloppy.config import get_default_ignores, load_config
+from sloppy.cache import DEFAULT_CACHE_DIR
+from sloppy.config import check_jobs, get_default_ignores, load_config
 from sloppy.detector import Detector
 from sloppy.reporter import JSONReporter, TerminalReporter
 from sloppy.scoring import calculate_score
 
 
+def _job_count(value: str) -> int:
+    """Parse a --jobs value for argparse."""
+    try:
+        return check_jobs(int(value))
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"expected 0 or a positive integer, got {value!r}") from e
+
+
 def create_parser() -> argparse.ArgumentParser:
     """Create the argument parser."""
     parser = argparse.ArgumentParser(
@@ -102,6 +111,31 @@ def create_parser() -> argparse.ArgumentParser:
         help="Check imports against installed packages (may cause false positives)",
     )
 
+    caching = parser.add_mutually_exclusive_group()
+    caching.add_argument(
+        "--cache",
+        action="store_true",
+        help=(
+            f"Cache per-file results in {DEFAULT_CACHE_DIR} to skip unchanged files; "
+            "entries are reused until the file, the enabled checks or the modules "
+            "next to it change"
+        ),
+    )
+    caching.add_argument(
+        "--no-cache",
+        action="store_true",
+        dest="no_cache",
+        help="Disable result caching (overrides config)",
+    )
+
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=_job_count,
+        metavar="N",
+        help="Scan files in N worker processes (0 = one per CPU, default: 1)",
+    )
+
     parser.add_argument(
         "--max-score",
         type=int,
@@ -124,11 +158,12 @@ def main(args: list[str] | None = None) -> int:
     parser = create_parser()
     opts = parser.parse_args(args)
 
-    # Load config from pyproject.toml
-    config = load_config()
-
-    # Merge CLI args into config (CLI takes precedence)
-    config.merge_cli_args(opts)
+    # Load config from pyproject.toml, then merge CLI args (CLI takes precedence)
+    try:
+        config = load_config()
+        config.merge_cli_args(opts)
+    except ValueError as e:
+        parser.error(str(e))
 
     # Determine severity threshold
     if opts.strict:
@@ -150,6 +185,8 @@ def main(args: list[str] | None = None) -> int:
         include_patterns=include_patterns,
         disabled_patterns=config.disable,
         min_severity=min_severity,
+        cache_dir=DEFAULT_CACHE_DIR if config.cache else None,
+        jobs=config.jobs,
     )
 
     # Collect all paths
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import sys
 from dataclasses import dataclass, field
+from itertools import chain
 from pathlib import Path
 from typing import Any
 
@@ -45,6 +46,12 @@ class Config:
     # When False (default), only checks for known AI hallucination patterns
     strict_imports: bool = False
 
+    # Cache per-file results on disk so unchanged files are skipped on re-runs
+    cache: bool = False
+
+    # Number of worker processes (0 = one per CPU)
+    jobs: int = 1
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Config:
         """Create config from a dictionary."""
@@ -57,6 +64,8 @@ class Config:
             format=data.get("format", "detailed"),
             ci=data.get("ci", False),
             strict_imports=data.get("strict-imports", False),
+            cache=data.get("cache", False),
+            jobs=check_jobs(data.get("jobs", 1)),
         )
 
     def merge_cli_args(self, args: Any) -> None:
@@ -99,6 +108,23 @@ class Config:
         if hasattr(args, "strict_imports") and args.strict_imports:
             self.strict_imports = True
 
+        # CLI cache flags override config
+        if hasattr(args, "cache") and args.cache:
+            self.cache = True
+        elif hasattr(args, "no_cache") and args.no_cache:
+            self.cache = False
+
+        # CLI jobs overrides config
+        if hasattr(args, "jobs") and args.jobs is not None:
+            self.jobs = check_jobs(args.jobs)
+
+
+def check_jobs(value: Any) -> int:
+    """Validate a worker process count, where 0 means one per CPU."""
+    if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+        raise ValueError(f"jobs must be 0 (one per CPU) or a positive integer, got {value!r}")
+    return value
+
 
 def find_config_file(start_path: Path | None = None) -> Path | None:
     """Find pyproject.toml by searching up from start_path."""
@@ -108,7 +134,7 @@ def find_config_file(start_path: Path | None = None) -> Path | None:
     current = start_path.resolve()
 
     # Search up the directory tree
-    for parent in [current] + list(current.parents):
+    for parent in chain((current,), current.parents):
         pyproject = parent / "pyproject.toml"
         if pyproject.is_file():
             return pyproject
@@ -4,12 +4,19 @@ from __future__ import annotations
 
 import ast
 import fnmatch
+import os
 import re
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
 from pathlib import Path
 
 from sloppy.analyzers.ast_analyzer import ASTAnalyzer
+from sloppy.analyzers.import_validator import clear_caches, local_module_state
+from sloppy.cache import IssueCache
+from sloppy.config import get_default_ignores
 from sloppy.patterns import get_all_patterns
-from sloppy.patterns.base import Issue
+from sloppy.patterns.base import BasePattern, Issue, RegexPattern
 from sloppy.patterns.helpers import get_multiline_string_lines
 
 SEVERITY_ORDER = {
@@ -19,6 +26,66 @@ SEVERITY_ORDER = {
     "critical": 3,
 }
 
+# Regex flags that can be expressed as scoped inline flags, e.g. (?i:...)
+_INLINE_FLAGS = {
+    re.IGNORECASE: "i",
+    re.MULTILINE: "m",
+    re.DOTALL: "s",
+    re.VERBOSE: "x",
+    re.ASCII: "a",
+}
+
+
+def _inline_regex(pattern: RegexPattern) -> str | None:
+    """Return pattern's regex as a self-contained group, or None if not possible."""
+    regex = pattern.pattern
+    if regex is None:
+        return None
+    flags = regex.flags & ~re.UNICODE
+    letters = "".join(letter for flag, letter in _INLINE_FLAGS.items() if flags & flag)
+    if flags & ~sum(_INLINE_FLAGS) or re.search(r"\\[1-9]", regex.pattern):
+        # Unsupported flags or numbered backreferences
+        return None
+    return f"(?{letters}:{regex.pattern})" if letters else f"(?:{regex.pattern})"
+
+
+def _build_line_prefilter(
+    patterns: list[BasePattern],
+) -> tuple[re.Pattern[str] | None, tuple[str, ...], list[BasePattern]]:
+    """Combine plain regex line patterns into one alternation.
+
+    A line that the combined regex does not match cannot match any of those
+    patterns, so they are skipped for it. Returns the combined regex, the
+    substrings one of which every such match contains ("" when a pattern
+    declares none), and the line patterns that must still run on every line.
+    """
+    alternatives = []
+    literals: set[str] = set()
+    unfiltered = []
+    for pattern in patterns:
+        regex = None
+        if (
+            isinstance(pattern, RegexPattern)
+            and type(pattern).check_line is RegexPattern.check_line
+        ):
+            regex = _inline_regex(pattern)
+            if regex is None and pattern.pattern is None:
+                # check_line never reports anything
+                continue
+        if regex is None:
+            unfiltered.append(pattern)
+        else:
+            alternatives.append(regex)
+            literals.add(pattern.required_literal or "")
+
+    if not alternatives:
+        return None, (), list(patterns)
+    try:
+        prefilter = re.compile("|".join(alternatives))
+    except re.error:
+        return None, (), list(patterns)
+    return prefilter, ("",) if "" in literals else tuple(sorted(literals)), unfiltered
+
 
 class Detector:
     """Main detector that orchestrates all pattern checks."""
@@ -30,6 +97,8 @@ class Detector:
         disabled_patterns: list[str] | None = None,
         min_severity: str = "low",
         root_path: Path | None = None,
+        cache_dir: Path | None = None,
+        jobs: int = 1,
     ):
         self.ignore_patterns = ignore_patterns or []
         self.include_patterns = include_patterns or []
@@ -37,40 +106,112 @@ class Detector:
         self.min_severity = min_severity
         self.min_severity_level = SEVERITY_ORDER.get(min_severity, 0)
         self.root_path = root_path or Path.cwd()
+        # Number of worker processes; 0 means one per CPU
+        self.jobs = jobs or os.cpu_count() or 1
+        self.cache_dir = cache_dir
+        self._resolved_root = self.root_path.resolve()
+        # Lexical form of the root with a trailing separator, for prefix checks
+        self._root_prefix = os.path.join(os.path.abspath(self.root_path), "")
+
+        # Compile glob patterns once rather than for every file
+        self._ignore_globs = [self._compile_pattern(p) for p in self.ignore_patterns]
+        self._include_globs = [self._compile_pattern(p) for p in self.include_patterns]
+        # Default ignores such as .venv or build also prune directories of
+        # that name at any depth; other patterns only match file paths
+        default_ignores = set(get_default_ignores())
+        self._ignore_dir_names = [
+            re.compile(fnmatch.translate(os.path.normcase(p)))
+            for p in self.ignore_patterns
+            if p in default_ignores and "/" not in p
+        ]
 
         # Load patterns
         self.patterns = [p for p in get_all_patterns() if p.id not in self.disabled_patterns]
+        self.line_patterns = [p for p in self.patterns if hasattr(p, "check_line")]
+        (
+            self._line_prefilter,
+            self._prefilter_literals,
+            self._unfiltered_line_patterns,
+        ) = _build_line_prefilter(self.line_patterns)
+
+        # Skip the AST walk entirely when nothing it reports is enabled
+        self.check_nesting = "deep_nesting" not in self.disabled_patterns
+        self.run_ast_analyzer = self.check_nesting or any(
+            hasattr(p, "check_node") for p in self.patterns
+        )
+        # Node type -> AST patterns, shared by every file's analyzer
+        self._patterns_by_type: dict[type, list[BasePattern]] = {}
+
+        # Optional per-file result cache; the enabled checks are part of the key
+        self.cache: IssueCache | None = None
+        if cache_dir is not None:
+            enabled = [p.id for p in self.patterns]
+            if self.check_nesting:
+                enabled.append("deep_nesting")
+            self.cache = IssueCache(cache_dir, salt=",".join(sorted(enabled)))
 
     def scan(self, paths: list[Path]) -> list[Issue]:
         """Scan all paths and return issues."""
-        issues: list[Issue] = []
+        clear_caches()
 
+        # Keyed by absolute path so overlapping arguments (e.g. a directory
+        # and a file inside it) scan each file once
+        found: dict[str, Path] = {}
         for path in paths:
             if path.is_file():
                 if self._should_scan(path):
-                    file_issues = self._scan_file(path)
-                    issues.extend(file_issues)
+                    found.setdefault(os.path.abspath(path), path)
             elif path.is_dir():
-                for file_path in path.rglob("*.py"):
+                for file_path in self._walk(str(path)):
                     if self._should_scan(file_path):
-                        file_issues = self._scan_file(file_path)
-                        issues.extend(file_issues)
-
-        # Filter by severity
-        issues = [
-            i for i in issues if SEVERITY_ORDER.get(i.severity.value, 0) >= self.min_severity_level
-        ]
+                        found.setdefault(os.path.abspath(file_path), file_path)
+        files = list(found.values())
 
-        # Sort by severity (critical first), then by file, then by line
-        issues.sort(
-            key=lambda i: (
-                -SEVERITY_ORDER.get(i.severity.value, 0),
-                i.file,
-                i.line,
-            )
-        )
-
-        return issues
+        issues: list[Issue] = []
+        if self.jobs > 1 and len(files) > 1:
+            with ProcessPoolExecutor(
+                max_workers=min(self.jobs, len(files)),
+                initializer=_init_worker,
+                initargs=(sorted(self.disabled_patterns), self.cache_dir),
+            ) as executor:
+                for file_issues in executor.map(_scan_file_worker, files, chunksize=16):
+                    issues.extend(file_issues)
+        else:
+            for file_path in files:
+                issues.extend(self._scan_file(file_path))
+
+        # Look up each issue's severity level once, then filter by it and
+        # sort by severity (critical first), then by file, then by line
+        severity_level = SEVERITY_ORDER.get
+        min_level = self.min_severity_level
+        keyed = []
+        for issue in issues:
+            level = severity_level(issue.severity.value, 0)
+            if level >= min_level:
+                keyed.append(((-level, issue.file, issue.line), issue))
+        keyed.sort(key=itemgetter(0))
+
+        return [issue for _, issue in keyed]
+
+    def _walk(self, directory: str) -> Iterator[Path]:
+        """Yield .py files under directory without entering ignored directories.
+
+        Subdirectories whose name matches a default ignore, e.g. .venv or
+        build, are skipped at any depth.
+        """
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            return
+
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                name = os.path.normcase(entry.name)
+                if not any(regex.match(name) for regex in self._ignore_dir_names):
+                    yield from self._walk(entry.path)
+            elif entry.name.endswith(".py") and entry.is_file():
+                yield Path(entry.path)
 
     def _should_scan(self, path: Path) -> bool:
         """Check if a file should be scanned."""
@@ -81,89 +222,144 @@ class Detector:
         rel_path = self._get_relative_posix_path(path)
 
         # Check ignore patterns
-        for pattern in self.ignore_patterns:
-            if self._match_pattern(rel_path, pattern):
-                return False
+        if self._matches_any(rel_path, self._ignore_globs):
+            return False
 
         # Check include patterns (if specified, file must match at least one)
-        if self.include_patterns:
-            matched = any(
-                self._match_pattern(rel_path, pattern) for pattern in self.include_patterns
-            )
-            if not matched:
-                return False
-
-        return True
+        return not self._include_globs or self._matches_any(rel_path, self._include_globs)
 
     def _get_relative_posix_path(self, path: Path) -> str:
         """Convert path to relative POSIX-style string for consistent matching."""
+        # Files under the root need no realpath syscalls
+        abs_path = os.path.abspath(path)
+        if abs_path.startswith(self._root_prefix):
+            return abs_path[len(self._root_prefix) :].replace(os.sep, "/")
+
         try:
-            rel_path = path.resolve().relative_to(self.root_path.resolve())
+            rel_path = path.resolve().relative_to(self._resolved_root)
         except ValueError:
             # Path is not relative to root, use absolute path
             rel_path = path.resolve()
         return rel_path.as_posix()
 
-    def _match_pattern(self, path_str: str, pattern: str) -> bool:
-        """Match path against a glob pattern using fnmatch.
+    @staticmethod
+    def _compile_pattern(pattern: str) -> tuple[re.Pattern[str], bool]:
+        """Compile a glob pattern into a regex.
 
-        Handles ** patterns for recursive matching.
-        All matching is done against POSIX-style relative paths.
+        Returns the regex and whether it should be matched against the
+        case-normalized path: simple patterns follow fnmatch.fnmatch, while
+        patterns containing ** match the POSIX path as-is.
         """
         # Normalize pattern to POSIX style
         pattern = pattern.replace("\\", "/")
 
-        # Handle ** patterns (recursive match)
-        if "**" in pattern:
-            # Convert ** to match any number of path segments
-            # e.g., "src/**/*.py" matches "src/a/b/c.py"
-            # Escape special regex chars except * and ?
-            regex_pattern = re.escape(pattern)
-            # Convert ** to match any path segments (including none)
-            regex_pattern = regex_pattern.replace(r"\*\*", ".*")
-            # Convert remaining * to match anything except /
-            regex_pattern = regex_pattern.replace(r"\*", "[^/]*")
-            # Convert ? to match single char except /
-            regex_pattern = regex_pattern.replace(r"\?", "[^/]")
-            regex_pattern = f"^{regex_pattern}$"
-
-            return bool(re.match(regex_pattern, path_str))
-
-        # Simple fnmatch for patterns without **
-        return fnmatch.fnmatch(path_str, pattern)
+        if "**" not in pattern:
+            return re.compile(fnmatch.translate(os.path.normcase(pattern))), True
+
+        # Convert ** to match any number of path segments
+        # e.g., "src/**/*.py" matches "src/a/b/c.py"
+        # Escape special regex chars except * and ?
+        regex_pattern = re.escape(pattern)
+        # Convert ** to match any path segments (including none)
+        regex_pattern = regex_pattern.replace(r"\*\*", ".*")
+        # Convert remaining * to match anything except /
+        regex_pattern = regex_pattern.replace(r"\*", "[^/]*")
+        # Convert ? to match single char except /
+        regex_pattern = regex_pattern.replace(r"\?", "[^/]")
+        return re.compile(f"^{regex_pattern}$"), False
+
+    @staticmethod
+    def _matches_any(path_str: str, patterns: list[tuple[re.Pattern[str], bool]]) -> bool:
+        """Check a POSIX-style relative path against compiled glob patterns."""
+        normalized = os.path.normcase(path_str)
+        return any(
+            regex.match(normalized if normcase else path_str) for regex, normcase in patterns
+        )
 
     def _scan_file(self, path: Path) -> list[Issue]:
         """Scan a single file."""
+        try:
+            source = path.read_bytes()
+        except OSError:
+            return []
+
+        if self.cache is None:
+            return self._analyze_source(path, source)
+
+        # Import checks also depend on which modules exist next to the file
+        key = self.cache.key(path, source, local_module_state(path.parent))
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        issues = self._analyze_source(path, source)
+        self.cache.set(key, issues)
+        return issues
+
+    def _analyze_source(self, path: Path, source: bytes) -> list[Issue]:
+        """Run all patterns on a file's source."""
         issues: list[Issue] = []
 
+        # Parse AST straight from the bytes, then decode once for the
+        # text-based checks
         try:
-            content = path.read_text(encoding="utf-8")
-        except (OSError, UnicodeDecodeError):
+            tree = ast.parse(source, filename=str(path))
+            content = source.decode("utf-8")
+        except (SyntaxError, ValueError):
             return issues
 
-        # Parse AST
-        try:
-            tree = ast.parse(content, filename=str(path))
-        except SyntaxError:
+        if self.run_ast_analyzer:
+            analyzer = ASTAnalyzer(
+                path, content, self.patterns, self.check_nesting, self._patterns_by_type
+            )
+            issues.extend(analyzer.analyze(tree))
+            lines = analyzer.source_lines
+            multiline_string_lines = analyzer.multiline_string_lines
+        elif self.line_patterns:
+            lines = content.splitlines()
+            multiline_string_lines = get_multiline_string_lines(content)
+        else:
             return issues
 
-        # Run AST analyzer
-        analyzer = ASTAnalyzer(path, content, self.patterns)
-        issues.extend(analyzer.analyze(tree))
-
-        # Get multi-line string locations for accurate string detection
-        multiline_string_lines = get_multiline_string_lines(content)
-
-        # Set multi-line context on patterns before line-based checks
+        # Set multi-line string locations on patterns before line-based checks
         for pattern in self.patterns:
             pattern.multiline_string_lines = multiline_string_lines
 
-        # Run line-based patterns
-        lines = content.splitlines()
-        for pattern in self.patterns:
-            if hasattr(pattern, "check_line"):
-                for lineno, line in enumerate(lines, start=1):
-                    pattern_issues = pattern.check_line(line, lineno, path)
-                    issues.extend(pattern_issues)
+        # Run line-based patterns in a single pass over the source lines; lines
+        # the prefilter rejects only need the patterns it doesn't cover
+        checks = [pattern.check_line for pattern in self.line_patterns]
+        unfiltered_checks = [pattern.check_line for pattern in self._unfiltered_line_patterns]
+        prefilter = self._line_prefilter
+        literals = self._prefilter_literals
+        for lineno, line in enumerate(lines, start=1):
+            line_checks = checks
+            if prefilter is not None:
+                # Substring tests are much cheaper than the regex and rule
+                # out most lines on their own
+                for literal in literals:
+                    if literal in line:
+                        if prefilter.search(line) is None:
+                            line_checks = unfiltered_checks
+                        break
+                else:
+                    line_checks = unfiltered_checks
+            for check in line_checks:
+                issues.extend(check(line, lineno, path))
 
         return issues
+
+
+# Per-process detector used by the worker functions below
+_worker_detector: Detector | None = None
+
+
+def _init_worker(disabled_patterns: list[str], cache_dir: Path | None) -> None:
+    """Set up the detector for a worker process."""
+    global _worker_detector
+    _worker_detector = Detector(disabled_patterns=disabled_patterns, cache_dir=cache_dir)
+
+
+def _scan_file_worker(path: Path) -> list[Issue]:
+    """Scan a single file in a worker process."""
+    assert _worker_detector is not None
+    return _worker_detector._scan_file(path)
@@ -1,5 +1,7 @@
 """Pattern registry."""
 
+from functools import cache
+
 from sloppy.patterns.base import BasePattern
 from sloppy.patterns.hallucinations import HALLUCINATION_PATTERNS
 from sloppy.patterns.noise import NOISE_PATTERNS
@@ -7,14 +9,23 @@ from sloppy.patterns.structure import STRUCTURE_PATTERNS
 from sloppy.patterns.style import STYLE_PATTERNS
 
 
-def get_all_patterns() -> list[BasePattern]:
-    """Get all registered patterns."""
-    return [
+@cache
+def _all_patterns() -> tuple[BasePattern, ...]:
+    """Build the registry once per process."""
+    return (
         *NOISE_PATTERNS,
         *HALLUCINATION_PATTERNS,
         *STYLE_PATTERNS,
         *STRUCTURE_PATTERNS,
-    ]
+    )
+
+
+def get_all_patterns() -> list[BasePattern]:
+    """Get all registered patterns.
+
+    Returns a new list each call; the pattern instances are shared.
+    """
+    return list(_all_patterns())
 
 
 __all__ = ["get_all_patterns", "BasePattern"]
@@ -3,11 +3,18 @@
 from __future__ import annotations
 
 import ast
+import sys
 from abc import ABC
+from collections.abc import Sequence
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 from re import Pattern as RePattern
+from typing import Any
+
+# Scans can produce many thousands of issues; drop the per-instance __dict__
+# where dataclasses support it (Python 3.10+)
+_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class Severity(Enum):
@@ -28,7 +35,7 @@ class Axis(Enum):
     STRUCTURE = "structure"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Issue:
     """A detected issue."""
 
@@ -93,6 +100,8 @@ class RegexPattern(BasePattern):
     """Pattern that matches via regex on lines."""
 
     pattern: RePattern[str] | None = None
+    # Substring every match contains; lines without it skip the regex
+    required_literal: str | None = None
 
     def check_line(
         self,
@@ -103,6 +112,8 @@ class RegexPattern(BasePattern):
         """Check a line for pattern matches."""
         if self.pattern is None:
             return []
+        if self.required_literal is not None and self.required_literal not in line:
+            return []
 
         issues = []
         for match in self.pattern.finditer(line):
@@ -127,6 +138,11 @@ class ASTPattern(BasePattern):
         node: ast.AST,
         file: Path,
         source_lines: list[str],
+        parents: Sequence[ast.AST] | None = None,
     ) -> list[Issue]:
-        """Check an AST node for issues."""
+        """Check an AST node for issues.
+
+        parents holds the node's ancestors, nearest last, when the caller
+        knows them. It may be the caller's live stack: read it, don't keep it.
+        """
         return []
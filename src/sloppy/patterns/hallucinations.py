@@ -4,8 +4,14 @@ from __future__ import annotations
 
 import ast
 import re
+from collections.abc import Sequence
 from pathlib import Path
 
+from sloppy.analyzers.import_validator import (
+    check_hallucinated_method,
+    check_known_hallucination,
+    is_likely_hallucinated_package,
+)
 from sloppy.patterns.base import ASTPattern, Issue, RegexPattern, Severity
 
 
@@ -16,6 +22,7 @@ class TodoPlaceholder(RegexPattern):
     severity = Severity.HIGH
     axis = "quality"
     message = "TODO placeholder - implementation needed"
+    required_literal = "#"
     pattern = re.compile(
         r"#\s*(TODO|FIXME|XXX|HACK)\s*:?\s*.*(implement|add|finish|complete|fill in|your code|logic here)",
         re.IGNORECASE,
@@ -29,62 +36,86 @@ class AssumptionComment(RegexPattern):
     severity = Severity.HIGH
     axis = "quality"
     message = "Assumption in code - verify before shipping"
+    required_literal = "#"
     pattern = re.compile(
         r"#\s*(assuming|assumes?|presumably|apparently|i think|we think|should be|might be)\b",
         re.IGNORECASE,
     )
 
 
-class PassPlaceholder(ASTPattern):
-    """Detect placeholder functions with just pass."""
-
-    id = "pass_placeholder"
-    severity = Severity.HIGH
-    axis = "quality"
-    message = "Placeholder function with pass - implementation needed"
-    node_types = (ast.FunctionDef, ast.AsyncFunctionDef)
-
-    ABSTRACT_DECORATORS = {
+# Decorators that indicate abstract/protocol methods where a stub body is valid
+_ABSTRACT_DECORATORS = frozenset(
+    {
         "abstractmethod",
         "abstractproperty",
         "abstractclassmethod",
         "abstractstaticmethod",
         "overload",
     }
-
-    def check_node(
+)
+
+# Markers of Protocol/ABC-like classes, matched as substrings of the class
+# header: its name, base classes and keyword arguments such as metaclass
+_INTERFACE_MARKERS = ("Protocol", "ABC", "ABCMeta", "Interface", "typing_extensions")
+
+
+def _is_interface_class(node: ast.ClassDef) -> bool:
+    """Check if a class header mentions Protocol/ABC or a similar marker."""
+    header = [node.name]
+    header.extend(ast.unparse(expr) for expr in (*node.bases, *(kw.value for kw in node.keywords)))
+    return any(marker in part for part in header for marker in _INTERFACE_MARKERS)
+
+
+def _placeholder_kind(body: list[ast.stmt]) -> str | None:
+    """Classify a function body that is only a stub, optionally after a docstring.
+
+    Returns "pass", "ellipsis" or "notimplemented", or None for a real body.
+    """
+    if not body:
+        return None
+    first = body[0]
+    if (
+        isinstance(first, ast.Expr)
+        and isinstance(first.value, ast.Constant)
+        and isinstance(first.value.value, str)
+    ):
+        # Skip docstring
+        if len(body) != 2:
+            return None
+        stmt = body[1]
+    elif len(body) == 1:
+        stmt = first
+    else:
+        return None
+
+    if isinstance(stmt, ast.Pass):
+        return "pass"
+    if isinstance(stmt, ast.Expr):
+        if isinstance(stmt.value, ast.Constant) and stmt.value.value is ...:
+            return "ellipsis"
+        return None
+    if isinstance(stmt, ast.Raise):
+        exc = stmt.exc
+        if isinstance(exc, ast.Call):
+            exc = exc.func
+        if isinstance(exc, ast.Name) and exc.id == "NotImplementedError":
+            return "notimplemented"
+    return None
+
+
+class _FuncPlaceholderMixin:
+    """Shared exemptions for the placeholder-function patterns."""
+
+    def _is_exempt(
         self,
-        node: ast.AST,
-        file: Path,
+        node: ast.FunctionDef | ast.AsyncFunctionDef,
         source_lines: list[str],
-    ) -> list[Issue]:
-        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            return []
-
-        # Skip if has abstract/overload decorator
-        if self._has_abstract_decorator(node):
-            return []
-
-        # Skip if likely a Protocol/ABC method
-        if self._is_likely_protocol_method(node, source_lines):
-            return []
-
-        # Check if body is just pass (optionally with docstring)
-        body = node.body
-        if len(body) == 1 and isinstance(body[0], ast.Pass):
-            return [self.create_issue_from_node(node, file, code=f"def {node.name}(...): pass")]
-
-        # Docstring + pass
-        if len(body) == 2:
-            has_docstring = (
-                isinstance(body[0], ast.Expr)
-                and isinstance(body[0].value, ast.Constant)
-                and isinstance(body[0].value.value, str)
-            )
-            if has_docstring and isinstance(body[1], ast.Pass):
-                return [self.create_issue_from_node(node, file, code=f"def {node.name}(...): pass")]
-
-        return []
+        parents: Sequence[ast.AST] | None,
+    ) -> bool:
+        """Check if a stub body is legitimate for this function."""
+        return self._has_abstract_decorator(node) or self._is_likely_protocol_method(
+            node, source_lines, parents
+        )
 
     def _has_abstract_decorator(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> bool:
         """Check if function has an abstract or overload decorator."""
@@ -99,145 +130,103 @@ class PassPlaceholder(ASTPattern):
                     dec_name = dec.func.id
                 elif isinstance(dec.func, ast.Attribute):
                     dec_name = dec.func.attr
-            if dec_name in self.ABSTRACT_DECORATORS:
+            if dec_name in _ABSTRACT_DECORATORS:
                 return True
         return False
 
     def _is_likely_protocol_method(
-        self, node: ast.FunctionDef | ast.AsyncFunctionDef, source_lines: list[str]
+        self,
+        node: ast.FunctionDef | ast.AsyncFunctionDef,
+        source_lines: list[str],
+        parents: Sequence[ast.AST] | None,
     ) -> bool:
-        """Check if function is likely a method inside a Protocol/ABC class."""
+        """Check if function is likely a method inside a Protocol/ABC class.
+
+        Uses the enclosing class when the caller passes the function's
+        ancestors, looking through if/try/with blocks in the class body.
+        Otherwise falls back to the nearest class header in the 49 lines
+        above the function.
+        """
         args = node.args.args
-        if not args:
+        if not args or args[0].arg not in ("self", "cls"):
             return False
-        first_arg = args[0].arg
-        if first_arg not in ("self", "cls"):
+        if parents is not None:
+            for ancestor in reversed(parents):
+                if isinstance(ancestor, ast.ClassDef):
+                    return _is_interface_class(ancestor)
+                if isinstance(ancestor, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)):
+                    return False
             return False
 
         func_line = node.lineno - 1
-        for i in range(func_line - 1, max(func_line - 50, -1), -1):
-            if i < 0 or i >= len(source_lines):
-                continue
+        for i in range(min(func_line, len(source_lines)) - 1, max(func_line - 50, -1), -1):
             line = source_lines[i].strip()
             if line.startswith("class ") and ":" in line:
-                if any(
-                    base in line
-                    for base in ("Protocol", "ABC", "ABCMeta", "Interface", "typing_extensions")
-                ):
-                    return True
-                break
+                return any(marker in line for marker in _INTERFACE_MARKERS)
         return False
 
 
-class EllipsisPlaceholder(ASTPattern):
-    """Detect placeholder functions with just ellipsis."""
+class PassPlaceholder(_FuncPlaceholderMixin, ASTPattern):
+    """Detect placeholder functions with just pass."""
 
-    id = "ellipsis_placeholder"
+    id = "pass_placeholder"
     severity = Severity.HIGH
     axis = "quality"
-    message = "Placeholder function with ... - implementation needed"
+    message = "Placeholder function with pass - implementation needed"
     node_types = (ast.FunctionDef, ast.AsyncFunctionDef)
 
-    # Decorators that indicate abstract/protocol methods where ... is valid
-    ABSTRACT_DECORATORS = {
-        "abstractmethod",
-        "abstractproperty",
-        "abstractclassmethod",
-        "abstractstaticmethod",
-        "overload",
-    }
-
     def check_node(
         self,
         node: ast.AST,
         file: Path,
         source_lines: list[str],
+        parents: Sequence[ast.AST] | None = None,
     ) -> list[Issue]:
         if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
             return []
 
-        # Skip if has abstract/overload decorator
-        if self._has_abstract_decorator(node):
+        # Body is just pass (optionally with docstring)
+        if _placeholder_kind(node.body) != "pass":
             return []
 
-        # Skip if likely a Protocol/ABC method
-        if self._is_likely_protocol_method(node, source_lines):
+        # Skip abstract/overload methods and likely Protocol/ABC methods
+        if self._is_exempt(node, source_lines, parents):
             return []
 
-        body = node.body
-
-        # Just ellipsis
-        if len(body) == 1:
-            if isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Constant):
-                if body[0].value.value is ...:
-                    return [
-                        self.create_issue_from_node(node, file, code=f"def {node.name}(...): ...")
-                    ]
-
-        # Docstring + ellipsis
-        if len(body) == 2:
-            has_docstring = (
-                isinstance(body[0], ast.Expr)
-                and isinstance(body[0].value, ast.Constant)
-                and isinstance(body[0].value.value, str)
-            )
-            if has_docstring and isinstance(body[1], ast.Expr):
-                if isinstance(body[1].value, ast.Constant) and body[1].value.value is ...:
-                    return [
-                        self.create_issue_from_node(node, file, code=f"def {node.name}(...): ...")
-                    ]
+        return [self.create_issue_from_node(node, file, code=f"def {node.name}(...): pass")]
 
-        return []
 
-    def _has_abstract_decorator(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> bool:
-        """Check if function has an abstract or overload decorator."""
-        for dec in node.decorator_list:
-            dec_name = None
-            if isinstance(dec, ast.Name):
-                dec_name = dec.id
-            elif isinstance(dec, ast.Attribute):
-                dec_name = dec.attr
-            elif isinstance(dec, ast.Call):
-                if isinstance(dec.func, ast.Name):
-                    dec_name = dec.func.id
-                elif isinstance(dec.func, ast.Attribute):
-                    dec_name = dec.func.attr
-            if dec_name in self.ABSTRACT_DECORATORS:
-                return True
-        return False
+class EllipsisPlaceholder(_FuncPlaceholderMixin, ASTPattern):
+    """Detect placeholder functions with just ellipsis."""
 
-    def _is_likely_protocol_method(
-        self, node: ast.FunctionDef | ast.AsyncFunctionDef, source_lines: list[str]
-    ) -> bool:
-        """Check if function is likely a method inside a Protocol/ABC class."""
-        # Check if it's a method (first arg is self/cls)
-        args = node.args.args
-        if not args:
-            return False
-        first_arg = args[0].arg
-        if first_arg not in ("self", "cls"):
-            return False
+    id = "ellipsis_placeholder"
+    severity = Severity.HIGH
+    axis = "quality"
+    message = "Placeholder function with ... - implementation needed"
+    node_types = (ast.FunctionDef, ast.AsyncFunctionDef)
 
-        # Look backwards in source to find class definition
-        func_line = node.lineno - 1
-        for i in range(func_line - 1, max(func_line - 50, -1), -1):
-            if i < 0 or i >= len(source_lines):
-                continue
-            line = source_lines[i].strip()
-            # Check for class definition with Protocol/ABC base
-            if line.startswith("class ") and ":" in line:
-                # Check if it inherits from Protocol, ABC, or similar
-                if any(
-                    base in line
-                    for base in ("Protocol", "ABC", "ABCMeta", "Interface", "typing_extensions")
-                ):
-                    return True
-                # Stop at first class definition found
-                break
-        return False
+    def check_node(
+        self,
+        node: ast.AST,
+        file: Path,
+        source_lines: list[str],
+        parents: Sequence[ast.AST] | None = None,
+    ) -> list[Issue]:
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            return []
+
+        # Body is just ... (optionally with docstring)
+        if _placeholder_kind(node.body) != "ellipsis":
+            return []
+
+        # Skip abstract/overload methods and likely Protocol/ABC methods
+        if self._is_exempt(node, source_lines, parents):
+            return []
+
+        return [self.create_issue_from_node(node, file, code=f"def {node.name}(...): ...")]
 
 
-class NotImplementedPlaceholder(ASTPattern):
+class NotImplementedPlaceholder(_FuncPlaceholderMixin, ASTPattern):
     """Detect placeholder functions that just raise NotImplementedError."""
 
     id = "notimplemented_placeholder"
@@ -246,100 +235,29 @@ class NotImplementedPlaceholder(ASTPattern):
     message = "Function raises NotImplementedError - implementation needed"
     node_types = (ast.FunctionDef, ast.AsyncFunctionDef)
 
-    ABSTRACT_DECORATORS = {
-        "abstractmethod",
-        "abstractproperty",
-        "abstractclassmethod",
-        "abstractstaticmethod",
-        "overload",
-    }
-
     def check_node(
         self,
         node: ast.AST,
         file: Path,
         source_lines: list[str],
+        parents: Sequence[ast.AST] | None = None,
     ) -> list[Issue]:
         if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
             return []
 
-        # Skip if has abstract/overload decorator
-        if self._has_abstract_decorator(node):
+        # Body just raises NotImplementedError (optionally with docstring)
+        if _placeholder_kind(node.body) != "notimplemented":
             return []
 
-        # Skip if likely a Protocol/ABC method
-        if self._is_likely_protocol_method(node, source_lines):
+        # Skip abstract/overload methods and likely Protocol/ABC methods
+        if self._is_exempt(node, source_lines, parents):
             return []
 
-        body = node.body
-
-        # Check last statement for raise NotImplementedError
-        effective_body = body
-        if len(body) >= 1:
-            # Skip docstring
-            if isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Constant):
-                if isinstance(body[0].value.value, str):
-                    effective_body = body[1:]
-
-        if len(effective_body) == 1 and isinstance(effective_body[0], ast.Raise):
-            exc = effective_body[0].exc
-            if isinstance(exc, ast.Call):
-                if isinstance(exc.func, ast.Name) and exc.func.id == "NotImplementedError":
-                    return [
-                        self.create_issue_from_node(
-                            node, file, code=f"def {node.name}(...): raise NotImplementedError"
-                        )
-                    ]
-            elif isinstance(exc, ast.Name) and exc.id == "NotImplementedError":
-                return [
-                    self.create_issue_from_node(
-                        node, file, code=f"def {node.name}(...): raise NotImplementedError"
-                    )
-                ]
-
-        return []
-
-    def _has_abstract_decorator(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> bool:
-        """Check if function has an abstract or overload decorator."""
-        for dec in node.decorator_list:
-            dec_name = None
-            if isinstance(dec, ast.Name):
-                dec_name = dec.id
-            elif isinstance(dec, ast.Attribute):
-                dec_name = dec.attr
-            elif isinstance(dec, ast.Call):
-                if isinstance(dec.func, ast.Name):
-                    dec_name = dec.func.id
-                elif isinstance(dec.func, ast.Attribute):
-                    dec_name = dec.func.attr
-            if dec_name in self.ABSTRACT_DECORATORS:
-                return True
-        return False
-
-    def _is_likely_protocol_method(
-        self, node: ast.FunctionDef | ast.AsyncFunctionDef, source_lines: list[str]
-    ) -> bool:
-        """Check if function is likely a method inside a Protocol/ABC class."""
-        args = node.args.args
-        if not args:
-            return False
-        first_arg = args[0].arg
-        if first_arg not in ("self", "cls"):
-            return False
-
-        func_line = node.lineno - 1
-        for i in range(func_line - 1, max(func_line - 50, -1), -1):
-            if i < 0 or i >= len(source_lines):
-                continue
-            line = source_lines[i].strip()
-            if line.startswith("class ") and ":" in line:
-                if any(
-                    base in line
-                    for base in ("Protocol", "ABC", "ABCMeta", "Interface", "typing_extensions")
-                ):
-                    return True
-                break
-        return False
+        return [
+            self.create_issue_from_node(
+                node, file, code=f"def {node.name}(...): raise NotImplementedError"
+            )
+        ]
 
 
 class HallucinatedImport(ASTPattern):
@@ -356,6 +274,7 @@ class HallucinatedImport(ASTPattern):
         node: ast.AST,
         file: Path,
         source_lines: list[str],
+        parents: Sequence[ast.AST] | None = None,
     ) -> list[Issue]:
         if not isinstance(node, ast.ImportFrom):
             return []
@@ -363,8 +282,6 @@ class HallucinatedImport(ASTPattern):
         if node.module is None:
             return []
 
-        from sloppy.analyzers.import_validator import check_known_hallucination
-
         issues = []
         for alias in node.names:
             name = alias.name
@@ -396,9 +313,8 @@ class WrongStdlibImport(ASTPattern):
         node: ast.AST,
         file: Path,
         source_lines: list[str],
+        parents: Sequence[ast.AST] | None = None,
     ) -> list[Issue]:
-        from sloppy.analyzers.import_validator import is_likely_hallucinated_package
-
         issues = []
 
         if isinstance(node, ast.Import):
@@ -446,6 +362,7 @@ class HallucinatedMethod(ASTPattern):
         node: ast.AST,
         file: Path,
         source_lines: list[str],
+        parents: Sequence[ast.AST] | None = None,
     ) -> list[Issue]:
         if not isinstance(node, ast.Call):
             return []
@@ -456,8 +373,6 @@ class HallucinatedMethod(ASTPattern):
 
         method_name = node.func.attr
 
-        from sloppy.analyzers.import_validator import check_hallucinated_method
-
         error_msg = check_hallucinated_method(method_name)
         if error_msg:
             # Try to get the source line for context
@@ -478,6 +393,24 @@ class HallucinatedMethod(ASTPattern):
         return []
 
 
+# Attributes from other languages that don't exist in Python
+INVALID_ATTRIBUTES = {
+    # JavaScript
+    "length": "Use len(obj) not obj.length - JavaScript pattern",
+    "size": "Use len(obj) not obj.size - JavaScript pattern (unless pandas/set)",
+    "prototype": "Python doesn't have prototypes - JavaScript pattern",
+    "__proto__": "Python doesn't have __proto__ - JavaScript pattern",
+    "constructor": "Use type(obj) or obj.__class__ - JavaScript pattern",
+    # Java/C#
+    "Length": "Use len(obj) not obj.Length - C# pattern",
+    "Count": "Use len(obj) not obj.Count - C# pattern",
+    # Go/Ruby
+    "nil": "Use None not nil - Go/Ruby pattern",
+    # Java/C#/JavaScript
+    "null": "Use None not null - Java/C#/JS pattern",
+}
+
+
 class HallucinatedAttribute(ASTPattern):
     """Detect attribute access that doesn't exist (like .length on list)."""
 
@@ -487,39 +420,24 @@ class HallucinatedAttribute(ASTPattern):
     message = "Hallucinated attribute - attribute does not exist in Python"
     node_types = (ast.Attribute,)
 
-    # Attributes from other languages that don't exist in Python
-    INVALID_ATTRIBUTES = {
-        # JavaScript
-        "length": "Use len(obj) not obj.length - JavaScript pattern",
-        "size": "Use len(obj) not obj.size - JavaScript pattern (unless pandas/set)",
-        "prototype": "Python doesn't have prototypes - JavaScript pattern",
-        "__proto__": "Python doesn't have __proto__ - JavaScript pattern",
-        "constructor": "Use type(obj) or obj.__class__ - JavaScript pattern",
-        # Java/C#
-        "Length": "Use len(obj) not obj.Length - C# pattern",
-        "Count": "Use len(obj) not obj.Count - C# pattern",
-        # Go/Ruby
-        "nil": "Use None not nil - Go/Ruby pattern",
-        # Java/C#/JavaScript
-        "null": "Use None not null - Java/C#/JS pattern",
-    }
-
     def check_node(
         self,
         node: ast.AST,
         file: Path,
         source_lines: list[str],
+        parents: Sequence[ast.AST] | None = None,
     ) -> list[Issue]:
         if not isinstance(node, ast.Attribute):
             return []
 
         # Skip if this is a method call (handled by HallucinatedMethod)
-        # We detect that by checking if this Attribute is the func of a Call
-        # This is tricky at this level, so we check specific attributes
+        if parents and isinstance(parents[-1], ast.Call) and parents[-1].func is node:
+            return []
 
         attr_name = node.attr
+        error_msg = INVALID_ATTRIBUTES.get(attr_name)
 
-        if attr_name in self.INVALID_ATTRIBUTES:
+        if error_msg is not None:
             # Try to get the source line for context
             lineno = getattr(node, "lineno", 0)
             code = None
@@ -531,7 +449,7 @@ class HallucinatedAttribute(ASTPattern):
                     node,
                     file,
                     code=code or f".{attr_name}",
-                    message=self.INVALID_ATTRIBUTES[attr_name],
+                    message=error_msg,
                 )
             ]
 
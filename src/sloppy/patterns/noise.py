@@ -12,6 +12,7 @@ class RedundantComment(RegexPattern):
     severity = Severity.MEDIUM
     axis = "noise"
     message = "Redundant comment restating obvious code"
+    required_literal = "#"
     pattern = re.compile(
         r"#\s*(increment|decrement|set|assign|return|get|initialize|init|create)\s+\w+\s*$",
         re.IGNORECASE,
@@ -25,7 +26,8 @@ class EmptyDocstring(RegexPattern):
     severity = Severity.MEDIUM
     axis = "noise"
     message = "Empty or placeholder docstring"
-    pattern = re.compile(r'"""(\s*|\s*TODO.*|\s*FIXME.*|\s*pass\s*|\s*\.\.\.\s*)"""', re.IGNORECASE)
+    required_literal = '"""'
+    pattern = re.compile(r'"""\s*(?:TODO.*|FIXME.*|pass\s*|\.\.\.\s*)?"""', re.IGNORECASE)
 
 
 class GenericDocstring(RegexPattern):
@@ -35,6 +37,7 @@ class GenericDocstring(RegexPattern):
     severity = Severity.LOW
     axis = "noise"
     message = "Generic docstring provides no useful information"
+    required_literal = '"""'
     pattern = re.compile(
         r'"""(This (function|method|class) (does|is|handles?|returns?|takes?) (stuff|things|something|it|the)\.?)"""',
         re.IGNORECASE,
@@ -48,8 +51,11 @@ class ChangelogComment(RegexPattern):
     severity = Severity.LOW
     axis = "noise"
     message = "Version history belongs in git commits, not code comments"
+    required_literal = "#"
     pattern = re.compile(
-        r"#\s*v?\d+\.\d+.*[-:].*\b(added|fixed|changed|removed|updated)\b", re.IGNORECASE
+        # [^-:]* stops at the first separator, avoiding quadratic backtracking
+        r"#\s*v?\d+\.\d+[^-:]*[-:].*\b(added|fixed|changed|removed|updated)\b",
+        re.IGNORECASE,
     )
 
 
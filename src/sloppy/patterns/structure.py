@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import ast
+from collections.abc import Sequence
 from pathlib import Path
 
 from sloppy.patterns.base import ASTPattern, Issue, Severity
@@ -17,48 +18,53 @@ class SingleMethodClass(ASTPattern):
     message = "Single-method class could be a function instead"
     node_types = (ast.ClassDef,)
 
-    SPECIAL_METHODS = {"__init__", "__new__", "__del__", "__repr__", "__str__"}
+    SPECIAL_METHODS = frozenset({"__init__", "__new__", "__del__", "__repr__", "__str__"})
 
     # Base classes that indicate interface/protocol patterns where single methods are valid
-    INTERFACE_BASES = {
-        "Protocol",
-        "ABC",
-        "ABCMeta",
-        "Interface",
-        "Generic",
-        "TypedDict",
-        "NamedTuple",
-        "Enum",
-        "IntEnum",
-        "StrEnum",
-        "Flag",
-        "IntFlag",
-        "Exception",
-        "BaseException",
-    }
+    INTERFACE_BASES = frozenset(
+        {
+            "Protocol",
+            "ABC",
+            "ABCMeta",
+            "Interface",
+            "Generic",
+            "TypedDict",
+            "NamedTuple",
+            "Enum",
+            "IntEnum",
+            "StrEnum",
+            "Flag",
+            "IntFlag",
+            "Exception",
+            "BaseException",
+        }
+    )
 
     # Decorators that indicate special class patterns
-    SPECIAL_DECORATORS = {
-        "dataclass",
-        "dataclasses.dataclass",
-        "attrs",
-        "attr.s",
-        "attr.attrs",
-        "define",
-        "attr.define",
-        "frozen",
-        "attr.frozen",
-        "runtime_checkable",
-        "typing.runtime_checkable",
-        "final",
-        "typing.final",
-    }
+    SPECIAL_DECORATORS = frozenset(
+        {
+            "dataclass",
+            "dataclasses.dataclass",
+            "attrs",
+            "attr.s",
+            "attr.attrs",
+            "define",
+            "attr.define",
+            "frozen",
+            "attr.frozen",
+            "runtime_checkable",
+            "typing.runtime_checkable",
+            "final",
+            "typing.final",
+        }
+    )
 
     def check_node(
         self,
         node: ast.AST,
         file: Path,
         source_lines: list[str],
+        parents: Sequence[ast.AST] | None = None,
     ) -> list[Issue]:
         if not isinstance(node, ast.ClassDef):
             return []
@@ -14,6 +14,7 @@ class OverconfidentComment(RegexPattern):
     severity = Severity.MEDIUM
     axis = "style"
     message = "Overconfident comment - verify claim before shipping"
+    required_literal = "#"
     pattern = re.compile(
         r"#\s*(obviously|clearly|simply|just|easy|trivial|basically|of course|naturally)\b",
         re.IGNORECASE,
@@ -27,6 +28,7 @@ class HedgingComment(RegexPattern):
     severity = Severity.HIGH
     axis = "style"
     message = "Hedging comment suggests uncertainty - verify code works"
+    required_literal = "#"
     pattern = re.compile(
         r"#\s*(should work|hopefully|probably|might work|try this|i think|seems to|appears to)\b",
         re.IGNORECASE,
@@ -40,6 +42,7 @@ class ApologeticComment(RegexPattern):
     severity = Severity.MEDIUM
     axis = "style"
     message = "Apologetic comment - fix the issue instead of apologizing"
+    required_literal = "#"
     pattern = re.compile(
         r"#\s*(sorry|hack|hacky|ugly|bad|terrible|awful|gross|yuck|forgive)\b", re.IGNORECASE
     )
@@ -0,0 +1,98 @@
+"""Tests for the AST analyzer."""
+
+import ast
+import sys
+from pathlib import Path
+
+import pytest
+
+from sloppy.analyzers.ast_analyzer import ASTAnalyzer
+from sloppy.patterns import get_all_patterns
+from sloppy.patterns.base import ASTPattern
+from sloppy.patterns.helpers import get_multiline_string_lines
+
+
+def test_multiline_string_lines_collected_during_visit():
+    """Test that multi-line string lines match the standalone helper."""
+    source = '''
+def func():
+    """
+    Docstring spanning
+    several lines.
+    """
+    text = """one
+two"""
+    return "single line"
+'''
+    analyzer = ASTAnalyzer(Path("test.py"), source, [])
+    analyzer.analyze(ast.parse(source))
+
+    assert analyzer.multiline_string_lines == get_multiline_string_lines(source)
+    assert analyzer.multiline_string_lines == {3, 4, 5, 6, 7, 8}
+
+
+def test_get_all_patterns_returns_new_list():
+    """Test that callers get their own list of the shared pattern instances."""
+    patterns = get_all_patterns()
+    patterns.clear()
+
+    again = get_all_patterns()
+    assert isinstance(again, list)
+    assert again
+    assert all(a is b for a, b in zip(again, get_all_patterns()))
+
+
+def test_pattern_index_shared_between_analyzers():
+    """Test that a shared node-type index is filled once and reused."""
+    patterns = get_all_patterns()
+    index: dict = {}
+
+    first = ASTAnalyzer(Path("a.py"), "def f():\n    pass\n", patterns, patterns_by_type=index)
+    first.analyze(ast.parse(first.source))
+    function_patterns = index[ast.FunctionDef]
+
+    second = ASTAnalyzer(Path("b.py"), "def g():\n    pass\n", patterns, patterns_by_type=index)
+    issues = second.analyze(ast.parse(second.source))
+
+    assert index[ast.FunctionDef] is function_patterns
+    assert [i.pattern_id for i in issues] == ["pass_placeholder"]
+
+
+def test_patterns_receive_ancestors():
+    """Test that patterns are given the ancestors of each node they check."""
+
+    class RecordParents(ASTPattern):
+        id = "record_parents"
+        node_types = (ast.FunctionDef,)
+
+        def __init__(self):
+            self.parents = {}
+
+        def check_node(self, node, file, source_lines, parents=None):
+            self.parents[node.name] = [type(p).__name__ for p in parents]
+            return []
+
+    source = "class A:\n    def method(self):\n        def inner():\n            pass\n"
+    pattern = RecordParents()
+    ASTAnalyzer(Path("test.py"), source, [pattern]).analyze(ast.parse(source))
+
+    assert pattern.parents == {
+        "method": ["Module", "ClassDef"],
+        "inner": ["Module", "ClassDef", "FunctionDef"],
+    }
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="type statements need Python 3.12")
+def test_type_alias_name_visited():
+    """Test that the Name target of a type alias is visited like other children."""
+
+    class NameRecorder(ASTAnalyzer):
+        def visit_Name(self, node):
+            self.names.append(node.id)
+
+    source = "type Pair = tuple[int, int]\n"
+    analyzer = NameRecorder(Path("test.py"), source, [])
+    analyzer.names = []
+    analyzer.analyze(ast.parse(source))
+
+    assert analyzer.names == ["Pair", "tuple", "int", "int"]
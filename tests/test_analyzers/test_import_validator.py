@@ -0,0 +1,43 @@
+"""Tests for import validation."""
+
+from pathlib import Path
+
+from sloppy.analyzers.import_validator import clear_caches, is_likely_hallucinated_package
+
+
+def test_local_module_not_flagged(tmp_path: Path):
+    """Test that a sibling utils.py makes 'import utils' valid."""
+    (tmp_path / "utils.py").write_text("")
+    source = tmp_path / "main.py"
+
+    assert is_likely_hallucinated_package("utils", source_file=source) is None
+
+
+def test_module_in_parent_package_not_flagged(tmp_path: Path):
+    """Test that modules are found in parent directories of a package."""
+    package = tmp_path / "pkg"
+    (package / "sub").mkdir(parents=True)
+    (package / "__init__.py").write_text("")
+    (package / "sub" / "__init__.py").write_text("")
+    (package / "helpers").mkdir()
+    source = package / "sub" / "module.py"
+
+    assert is_likely_hallucinated_package("helpers.io", source_file=source) is None
+
+
+def test_generic_module_flagged_without_local_file(tmp_path: Path):
+    """Test that 'import common' is flagged when no local module exists."""
+    source = tmp_path / "main.py"
+
+    assert is_likely_hallucinated_package("common", source_file=source) is not None
+
+
+def test_clear_caches_sees_new_local_module(tmp_path: Path):
+    """Test that a module created after a lookup is found once caches are cleared."""
+    source = tmp_path / "main.py"
+    assert is_likely_hallucinated_package("helpers", source_file=source) is not None
+
+    (tmp_path / "helpers.py").write_text("")
+    clear_caches()
+
+    assert is_likely_hallucinated_package("helpers", source_file=source) is None
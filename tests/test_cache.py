@@ -0,0 +1,95 @@
+"""Tests for the per-file issue cache."""
+
+from pathlib import Path
+
+from sloppy.analyzers.import_validator import clear_caches, local_module_state
+from sloppy.cache import IssueCache
+from sloppy.detector import Detector
+from sloppy.patterns.base import Issue, Severity
+
+
+def test_cache_round_trip(tmp_path: Path):
+    """Test that stored issues are returned unchanged."""
+    cache = IssueCache(tmp_path / "cache")
+    issue = Issue(
+        pattern_id="pass_placeholder",
+        severity=Severity.HIGH,
+        axis="quality",
+        file=Path("src/module.py"),
+        line=3,
+        column=0,
+        message="Placeholder function with pass - implementation needed",
+        code="def f(...): pass",
+    )
+    key = cache.key(Path("src/module.py"), b"def f():\n    pass\n")
+    assert cache.get(key) is None
+
+    cache.set(key, [issue])
+    assert cache.get(key) == [issue]
+
+
+def test_cache_key_changes_with_content(tmp_path: Path):
+    """Test that editing a file invalidates its cache entry."""
+    cache = IssueCache(tmp_path / "cache")
+    path = Path("module.py")
+    assert cache.key(path, b"x = 1\n") != cache.key(path, b"x = 2\n")
+
+
+def test_detector_uses_cache(tmp_python_file, tmp_path: Path, monkeypatch):
+    """Test that a second scan is served from the cache without re-analyzing."""
+    file = tmp_python_file("def placeholder_func():\n    pass\n")
+    cache_dir = tmp_path / ".sloppy_cache"
+
+    first = Detector(cache_dir=cache_dir).scan([file])
+    assert any(cache_dir.rglob("*.json"))
+
+    def fail(*args):
+        raise AssertionError("cache miss: file was analyzed again")
+
+    monkeypatch.setattr(Detector, "_analyze_source", fail)
+    second = Detector(cache_dir=cache_dir).scan([file])
+    assert second == first
+    assert [i.pattern_id for i in second] == ["pass_placeholder"]
+
+
+def test_cache_respects_disabled_nesting_check(tmp_python_file, tmp_path: Path):
+    """Test that disabling deep_nesting isn't undone by a cached scan."""
+    nested = "".join(f"{'    ' * i}if x:\n" for i in range(6)) + "    " * 6 + "y = 1\n"
+    file = tmp_python_file(nested)
+    cache_dir = tmp_path / ".sloppy_cache"
+
+    first = Detector(cache_dir=cache_dir).scan([file])
+    assert "deep_nesting" in {i.pattern_id for i in first}
+
+    second = Detector(cache_dir=cache_dir, disabled_patterns=["deep_nesting"]).scan([file])
+    assert "deep_nesting" not in {i.pattern_id for i in second}
+
+
+def test_cache_sees_added_local_module(tmp_path: Path):
+    """Test that adding a module next to a file invalidates its cached import checks."""
+    project = tmp_path / "project"
+    project.mkdir()
+    main = project / "main.py"
+    main.write_text("import utils\n")
+    cache_dir = tmp_path / ".sloppy_cache"
+
+    first = Detector(cache_dir=cache_dir).scan([main])
+    assert [i.pattern_id for i in first] == ["wrong_stdlib_import"]
+
+    (project / "utils.py").touch()
+    assert Detector(cache_dir=cache_dir).scan([main]) == []
+
+    (project / "utils.py").unlink()
+    assert Detector(cache_dir=cache_dir).scan([main]) == first
+
+
+def test_cache_key_ignores_unimportable_entries(tmp_path: Path):
+    """Test that cache and bytecode directories don't invalidate neighbouring entries."""
+    (tmp_path / "main.py").touch()
+    before = local_module_state(tmp_path)
+
+    (tmp_path / ".sloppy_cache").mkdir()
+    (tmp_path / "__pycache__").mkdir()
+    (tmp_path / "notes.txt").touch()
+    clear_caches()
+    assert local_module_state(tmp_path) == before
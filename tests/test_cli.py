@@ -0,0 +1,17 @@
+"""Tests for the command-line interface."""
+
+import pytest
+
+from sloppy.cli import create_parser
+
+
+def test_jobs_option_rejects_negative_values(capsys):
+    """Test that --jobs accepts 0 and positive counts but rejects negatives."""
+    parser = create_parser()
+
+    assert parser.parse_args(["--jobs", "0"]).jobs == 0
+    assert parser.parse_args(["-j", "4"]).jobs == 4
+
+    with pytest.raises(SystemExit):
+        parser.parse_args(["--jobs", "-1"])
+    assert "expected 0 or a positive integer" in capsys.readouterr().err
@@ -2,6 +2,8 @@
 
 from pathlib import Path
 
+import pytest
+
 from sloppy.config import Config, find_config_file, get_default_ignores, load_config
 
 
@@ -137,3 +139,37 @@ def test_merge_cli_args():
     assert config.max_score == 75
     assert config.format == "compact"
     assert config.ci is True
+
+
+def test_merge_cli_cache_flags():
+    """Test that --cache and --no-cache override the config setting."""
+
+    class CacheArgs:
+        cache = True
+        no_cache = False
+
+    class NoCacheArgs:
+        cache = False
+        no_cache = True
+
+    config = Config()
+    config.merge_cli_args(CacheArgs())
+    assert config.cache is True
+
+    config = Config.from_dict({"cache": True})
+    config.merge_cli_args(NoCacheArgs())
+    assert config.cache is False
+
+
+def test_negative_jobs_rejected():
+    """Test that negative worker counts are rejected from config and CLI args."""
+
+    class JobsArgs:
+        jobs = -2
+
+    with pytest.raises(ValueError, match="jobs"):
+        Config.from_dict({"jobs": -1})
+    with pytest.raises(ValueError, match="jobs"):
+        Config().merge_cli_args(JobsArgs())
+
+    assert Config.from_dict({"jobs": 0}).jobs == 0
@@ -0,0 +1,104 @@
+"""Tests for the detector."""
+
+from pathlib import Path
+
+from sloppy.config import get_default_ignores
+from sloppy.detector import Detector
+
+
+def test_ignore_and_include_patterns(tmp_path: Path):
+    """Test simple and ** globs against paths relative to the root."""
+    for rel in ("src/app.py", "src/pkg/deep/mod.py", "tests/test_app.py"):
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_text("")
+
+    detector = Detector(
+        ignore_patterns=["tests/*", "src/**/deep/*.py"],
+        include_patterns=["src/*"],
+        root_path=tmp_path,
+    )
+
+    assert detector._should_scan(tmp_path / "src/app.py")
+    assert not detector._should_scan(tmp_path / "src/pkg/deep/mod.py")
+    assert not detector._should_scan(tmp_path / "tests/test_app.py")
+
+
+def test_parallel_scan_matches_serial(tmp_path: Path):
+    """Test that scanning with worker processes reports the same issues."""
+    for i in range(3):
+        (tmp_path / f"mod{i}.py").write_text(f"def func{i}():\n    pass  # TODO: implement\n")
+
+    serial = Detector(root_path=tmp_path).scan([tmp_path])
+    parallel = Detector(root_path=tmp_path, jobs=2).scan([tmp_path])
+
+    assert parallel == serial
+    assert len(serial) == 6
+
+
+def test_disabling_all_ast_checks_skips_analyzer(tmp_python_file):
+    """Test that line patterns still run when every AST check is disabled."""
+    nested = "".join(f"{'    ' * i}if x:\n" for i in range(6)) + "    " * 6 + "pass\n"
+    file = tmp_python_file(nested + "y = 1  # TODO: implement this\n")
+    ast_ids = [p.id for p in Detector().patterns if hasattr(p, "check_node")]
+
+    detector = Detector(disabled_patterns=[*ast_ids, "deep_nesting"])
+
+    assert not detector.run_ast_analyzer
+    assert [i.pattern_id for i in detector.scan([file])] == ["todo_placeholder"]
+    assert "deep_nesting" in {i.pattern_id for i in Detector().scan([file])}
+
+
+def test_scan_prunes_default_ignored_directories(tmp_path: Path):
+    """Test that default ignores prune directories of that name at any depth."""
+    for rel in ("src/app.py", ".venv/lib/site.py", "build/gen.py", "src/pkg/.venv/x.py"):
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_text("def func():\n    pass\n")
+
+    detector = Detector(ignore_patterns=get_default_ignores(), root_path=tmp_path)
+
+    expected = {tmp_path / "src" / "app.py"}
+    assert set(detector._walk(str(tmp_path))) == expected
+    assert {i.file for i in detector.scan([tmp_path])} == expected
+
+
+def test_explicit_file_in_ignored_directory_scanned(tmp_path: Path):
+    """Test that a file passed directly is scanned even inside a default-ignored directory."""
+    file = tmp_path / "build" / "gen.py"
+    file.parent.mkdir()
+    file.write_text("def func():\n    pass\n")
+
+    detector = Detector(ignore_patterns=get_default_ignores(), root_path=tmp_path)
+
+    assert [i.file for i in detector.scan([file])] == [file]
+
+
+def test_user_ignore_patterns_match_file_paths(tmp_path: Path):
+    """Test that user patterns match file paths and don't prune directories by name."""
+    for rel in ("gen/a.py", "src/gen/b.py"):
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_text("def func():\n    pass\n")
+
+    detector = Detector(ignore_patterns=["gen", "src/gen/*"], root_path=tmp_path)
+
+    assert {i.file for i in detector.scan([tmp_path])} == {tmp_path / "gen" / "a.py"}
+
+
+def test_overlapping_paths_scanned_once(tmp_python_file):
+    """Test that a file reached through two arguments is reported once."""
+    file = tmp_python_file("def func():\n    pass\n")
+
+    issues = Detector().scan([file.parent, file])
+
+    assert [i.pattern_id for i in issues] == ["pass_placeholder"]
+
+
+def test_line_prefilter_keeps_every_match(tmp_python_file):
+    """Test that the combined line prefilter doesn't drop overlapping matches."""
+    file = tmp_python_file("x = 1  # TODO: implement this  # hopefully\ny = 2\n")
+
+    detector = Detector()
+    assert detector._line_prefilter is not None
+    assert {i.pattern_id for i in detector.scan([file])} == {"todo_placeholder", "hedging_comment"}
+
+    detector = Detector(disabled_patterns=["hedging_comment"])
+    assert [i.pattern_id for i in detector.scan([file])] == ["todo_placeholder"]
@@ -1,6 +1,10 @@
 """Tests for hallucination detection patterns."""
 
+import ast
+from pathlib import Path
+
 from sloppy.detector import Detector
+from sloppy.patterns.hallucinations import HallucinatedAttribute, PassPlaceholder
 
 
 def test_pass_placeholder_detected(tmp_python_file):
@@ -61,6 +65,159 @@ def real_func(x):
     assert len(placeholder_issues) == 0
 
 
+def test_abstract_and_protocol_stubs_not_flagged(tmp_python_file):
+    """Test that stub bodies are allowed on abstract and Protocol methods."""
+    code = """
+from abc import ABC, abstractmethod
+from typing import Protocol
+
+
+class Base(ABC):
+    @abstractmethod
+    def run(self):
+        pass
+
+
+class Reader(Protocol):
+    def read(self):
+        ...
+
+    def close(self):
+        raise NotImplementedError
+"""
+    file = tmp_python_file(code)
+    detector = Detector()
+    issues = detector.scan([file])
+
+    placeholder_ids = {"pass_placeholder", "ellipsis_placeholder", "notimplemented_placeholder"}
+    assert not [i for i in issues if i.pattern_id in placeholder_ids]
+
+
+def test_protocol_exemption_follows_class_body(tmp_python_file):
+    """Test that the Protocol exemption covers the whole class body and nothing after it."""
+    filler = "".join(f"    x{n} = {n}\n" for n in range(60))
+    code = f"""
+from typing import Protocol
+
+
+class Reader(Protocol):
+{filler}
+    def read(self):
+        ...
+
+
+def helper(self):
+    ...
+"""
+    file = tmp_python_file(code)
+    detector = Detector()
+    issues = detector.scan([file])
+
+    placeholder_issues = [i for i in issues if i.pattern_id == "ellipsis_placeholder"]
+    assert [i.code for i in placeholder_issues] == ["def helper(...): ..."]
+
+
+def test_gated_protocol_and_abc_stubs_not_flagged(tmp_python_file):
+    """Test that stubs under if/try blocks in a Protocol or ABC body stay exempt."""
+    code = """
+import sys
+from abc import ABC
+from typing import Protocol
+
+
+class Reader(Protocol):
+    if sys.version_info >= (3, 10):
+        def read(self):
+            ...
+    else:
+        def read(self, n):
+            ...
+
+
+class Base(ABC):
+    try:
+        def run(self):
+            raise NotImplementedError
+    except ImportError:
+        def run(self):
+            pass
+
+
+class Plain:
+    if sys.version_info >= (3, 10):
+        def read(self):
+            ...
+
+
+class Writer(Protocol):
+    def write(self):
+        def inner(self):
+            ...
+        return inner
+"""
+    file = tmp_python_file(code)
+    detector = Detector()
+    issues = detector.scan([file])
+
+    placeholder_ids = {"pass_placeholder", "ellipsis_placeholder", "notimplemented_placeholder"}
+    assert [i.line for i in issues if i.pattern_id in placeholder_ids] == [27, 33]
+
+
+def test_interface_markers_match_anywhere_in_class_header(tmp_python_file):
+    """Test that Protocol/ABC markers match as substrings of the class header."""
+    code = """
+import abc
+import typing_extensions
+
+
+class NotAProtocolButAnImplicitSubclass:
+    def read(self):
+        ...
+
+
+class Base(metaclass=abc.ABCMeta):
+    def run(self):
+        pass
+
+
+class Extended(typing_extensions.Generic):
+    def close(self):
+        raise NotImplementedError
+
+
+class Plain(Base):
+    def write(self):
+        ...
+"""
+    file = tmp_python_file(code)
+    detector = Detector()
+    issues = detector.scan([file])
+
+    placeholder_ids = {"pass_placeholder", "ellipsis_placeholder", "notimplemented_placeholder"}
+    assert [i.code for i in issues if i.pattern_id in placeholder_ids] == ["def write(...): ..."]
+
+
+def test_protocol_stub_exempt_without_analyzer():
+    """Test that check_node exempts Protocol methods with or without ancestors."""
+    source = """
+from typing import Protocol
+
+
+class Reader(Protocol):
+    def read(self):
+        pass
+"""
+    tree = ast.parse(source)
+    reader = tree.body[1]
+    method = reader.body[0]
+    pattern = PassPlaceholder()
+    lines = source.splitlines()
+
+    assert pattern.check_node(method, Path("test.py"), lines) == []
+    assert pattern.check_node(method, Path("test.py"), lines, parents=[tree, reader]) == []
+    assert len(pattern.check_node(method, Path("test.py"), lines, parents=[tree])) == 1
+
+
 def test_hallucinated_import_wrong_module(tmp_python_file):
     """Test that imports from wrong modules are detected."""
     code = """
@@ -183,6 +340,31 @@ n = items.length
     assert "len(obj)" in attr_issues[0].message
 
 
+def test_hallucinated_method_call_reported_once(tmp_python_file):
+    """Test that .length() is left to the method check, not reported twice."""
+    code = """
+items = [1, 2, 3]
+n = items.length()
+"""
+    file = tmp_python_file(code)
+    detector = Detector()
+    issues = detector.scan([file])
+
+    assert [i.pattern_id for i in issues] == ["hallucinated_method"]
+
+
+def test_hallucinated_attribute_checks_call_arguments():
+    """Test that only the callee of a call is skipped, not attributes in its arguments."""
+    call = ast.parse("print(items.length)").body[0].value
+    attribute = call.args[0]
+    pattern = HallucinatedAttribute()
+
+    assert len(pattern.check_node(attribute, Path("test.py"), [], parents=[call])) == 1
+    assert (
+        pattern.check_node(attribute, Path("test.py"), [], parents=[ast.Call(func=attribute)]) == []
+    )
+
+
 def test_valid_method_not_flagged(tmp_python_file):
     """Test that valid Python methods are not flagged."""
     code = """
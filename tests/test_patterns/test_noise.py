@@ -0,0 +1,48 @@
+"""Tests for noise pattern detection."""
+
+import time
+
+from sloppy.detector import Detector
+from sloppy.patterns.noise import ChangelogComment
+
+
+def test_empty_docstring_detected(tmp_python_file):
+    """Test that empty and placeholder docstrings are detected."""
+    code = '''
+def first():
+    """"""
+
+def second():
+    """  TODO: write this  """
+'''
+    file = tmp_python_file(code)
+    detector = Detector()
+    issues = detector.scan([file])
+
+    doc_issues = [i for i in issues if i.pattern_id == "empty_docstring"]
+    assert [i.line for i in doc_issues] == [3, 6]
+
+
+def test_changelog_comment_detected(tmp_python_file):
+    """Test that version history comments are detected."""
+    code = """
+# v1.2: added retry support
+x = 1
+"""
+    file = tmp_python_file(code)
+    detector = Detector()
+    issues = detector.scan([file])
+
+    assert [i.pattern_id for i in issues] == ["changelog_in_code"]
+
+
+def test_changelog_regex_is_linear_on_long_lines():
+    """Test that a long non-matching comment doesn't backtrack quadratically."""
+    # Quadratic backtracking would take minutes on this line; linear takes ms
+    line = "# 1.1" + "-" * 100_000
+
+    start = time.perf_counter()
+    match = ChangelogComment.pattern.search(line)
+
+    assert match is None
+    assert time.perf_counter() - start < 2.0